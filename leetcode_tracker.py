@@ -1,8 +1,9 @@
 """
 LeetCode Daily Tracker v4
-- Reads Name + LeetCode ID from Sheet1 of the Excel file
-- Updates Daily Tracking, Overall Stats, and Contest sheets
-- Sends daily email report at 9:30 PM with Excel attached
+- Reads Name + Reg No + Section + LeetCode ID from Sheet1 of the Excel file
+- Updates Daily Tracking, Overall Stats, Contest and per-section sheets
+- Sends each section's report (with its own Excel) to that section's mentor at 9:30 PM
+- Answers offline queries over saved snapshots (--query / --serve)
 - Run via RUN_TRACKER.bat
 """
 
@@ -12,17 +13,29 @@ import time
 import json
 import smtplib
 import subprocess
+import tempfile
 import requests
 import openpyxl
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email import encoders
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from datetime import datetime, date, timedelta
 from pathlib import Path
 
+try:
+    import orjson                        # optional: much faster JSON parsing
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # ─────────────────────────── CONFIGURATION ───────────────────────────────────
 SCRIPT_DIR   = Path(__file__).parent.resolve()
 EXCEL_FILE   = SCRIPT_DIR / "leetcode_OVERALL_DAILY_REPORT.xlsx"
@@ -34,30 +47,29 @@ TASK_NAME_EMAIL = "LeetCodeDailyTracker_Email"
 import os
 SENDER_EMAIL    = os.environ.get("SENDER_EMAIL", "")
 SENDER_PASSWORD = os.environ.get("SENDER_PASSWORD", "")
-```
-
-Save the file and re-upload it to GitHub.
-
----
-
-## ▶️ Step 6 — Test It Right Now (Don't Wait Till Night)
+# Unset and empty (an undefined GitHub secret) both mean "not configured";
+# with no recipient the email step is skipped.
+RECIPIENT_EMAIL = (os.environ.get("RECIPIENT_EMAIL") or "").strip()
+
+# Per-section mentors, e.g. SECTION_EMAILS="CSE J=a@x.com, CSE K=b@x.com".
+# Sections without an entry fall back to RECIPIENT_EMAIL.
+def parse_section_emails(raw: str) -> dict:
+    emails = {}
+    for pair in raw.split(","):
+        if "=" in pair:
+            section, addr = pair.split("=", 1)
+            if section.strip() and addr.strip():
+                emails[section.strip()] = addr.strip()
+    return emails
+
+SECTION_EMAILS = parse_section_emails(os.environ.get("SECTION_EMAILS") or "")
+
+# ──────────────── QUERY SERVICE CONFIGURATION ────────────────────────────────
+SNAPSHOT_DIR     = SCRIPT_DIR / "snapshots"
+QUERY_HOST       = "127.0.0.1"
+QUERY_PORT       = int(os.environ.get("QUERY_PORT", "8765"))
+QUERY_CACHE_SIZE = 256
 
-1. In your repo → click **"Actions"** tab
-2. Click **"LeetCode Daily Tracker"** on the left
-3. Click **"Run workflow"** → **"Run workflow"** (green button)
-4. Watch it run live — takes 5-10 minutes depending on student count
-5. Check `prabhuv.cse@citchennai.net` for the email! ✅
-
----
-
-## ✅ What Happens Every Night
-```
-9:15 PM IST  →  GitHub servers wake up automatically
-               →  Fetches all student LeetCode data
-               →  Updates Excel file
-               →  Sends email to prabhuv.cse@citchennai.net
-               →  Saves updated Excel back to repo
-               →  Done! Your PC can be completely OFF 🎉
 # ─────────────────────────── LOGGING ─────────────────────────────────────────
 def log(msg=""):
     ts   = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -67,6 +79,8 @@ def log(msg=""):
         f.write(line + "\n")
 
 # ─────────────────────────── LEETCODE API ────────────────────────────────────
+# requests already sends Accept-Encoding: gzip, deflate (+ br when brotli
+# is installed), so compressed responses need no extra header here.
 HEADERS = {
     "Content-Type": "application/json",
     "Referer":      "https://leetcode.com",
@@ -74,86 +88,83 @@ HEADERS = {
 }
 API = "https://leetcode.com/graphql"
 
+# One keep-alive connection for the whole run instead of a TLS handshake per query
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
 def gql(query: str, variables: dict, timeout=15):
     try:
-        r = requests.post(API, json={"query": query, "variables": variables},
-                          headers=HEADERS, timeout=timeout)
+        r = SESSION.post(API, json={"query": query, "variables": variables},
+                         timeout=timeout)
         r.raise_for_status()
-        return r.json().get("data", {})
+        return json_loads(r.content).get("data", {})
     except Exception as e:
         return None
 
-def fetch_overall_stats(username: str):
-    q = """
-    query userProblemsSolved($username: String!) {
-      matchedUser(username: $username) {
-        submitStatsGlobal {
-          acSubmissionNum {
-            difficulty count
-          }
-        }
-      }
-    }"""
-    data = gql(q, {"username": username.strip()})
-    if not data:
-        return None
-    try:
-        nums = data["matchedUser"]["submitStatsGlobal"]["acSubmissionNum"]
-        d = {x["difficulty"]: x["count"] for x in nums}
-        return {
-            "easy":   d.get("Easy",  0),
-            "medium": d.get("Medium",0),
-            "hard":   d.get("Hard",  0),
-            "total":  d.get("All",   0),
-        }
-    except Exception:
-        return None
-
-def fetch_daily_stats(username: str, target_date: date):
-    q = """
-    query recentAcSubmissions($username: String!, $limit: Int!) {
-      recentAcSubmissionList(username: $username, limit: $limit) {
-        id
-        timestamp
-        title
-        titleSlug
-      }
-    }"""
-    data = gql(q, {"username": username.strip(), "limit": 50})
-    if not data:
-        return None
-    try:
-        subs = data.get("recentAcSubmissionList") or []
-    except Exception:
-        return None
+# Everything the tracker reads for one student, in one round trip. Only the
+# fields the sheets use are requested — the contest history in particular is
+# one entry per contest LeetCode has ever run, so every extra field there costs.
+STUDENT_QUERY = """
+query trackerStats($username: String!, $limit: Int!) {
+  matchedUser(username: $username) {
+    submitStatsGlobal { acSubmissionNum { difficulty count } }
+  }
+  recentAcSubmissionList(username: $username, limit: $limit) { timestamp titleSlug }
+  userContestRanking(username: $username) { rating globalRanking attendedContestsCount }
+  userContestRankingHistory(username: $username) {
+    attended ranking problemsSolved totalProblems contest { title }
+  }
+}"""
+
+# Problem difficulty never changes, so it is looked up once per slug per run
+DIFFICULTY_CACHE = {}
+
+def fetch_difficulties(slugs) -> dict:
+    """slug -> "Easy"/"Medium"/"Hard", batching unknown slugs into one aliased query."""
+    missing = [s for s in slugs if s not in DIFFICULTY_CACHE]
+    if missing:
+        params = ", ".join(f"$s{i}: String!" for i in range(len(missing)))
+        fields = " ".join(f"q{i}: question(titleSlug: $s{i}) {{ difficulty }}"
+                          for i in range(len(missing)))
+        data = gql(f"query questionDifficulty({params}) {{ {fields} }}",
+                   {f"s{i}": slug for i, slug in enumerate(missing)}, timeout=10) or {}
+        for i, slug in enumerate(missing):
+            diff = (data.get(f"q{i}") or {}).get("difficulty")
+            if diff:
+                DIFFICULTY_CACHE[slug] = diff
+    return {s: DIFFICULTY_CACHE.get(s) for s in slugs}
+
+def parse_overall_stats(data: dict):
+    nums = data["matchedUser"]["submitStatsGlobal"]["acSubmissionNum"]
+    d = {x["difficulty"]: x["count"] for x in nums}
+    return {
+        "easy":   d.get("Easy",  0),
+        "medium": d.get("Medium",0),
+        "hard":   d.get("Hard",  0),
+        "total":  d.get("All",   0),
+    }
 
+def parse_solved_slugs(data: dict, target_date: date) -> list:
+    """Unique problem slugs accepted on target_date; malformed entries are skipped."""
     seen = {}
-    for s in subs:
-        ts    = int(s.get("timestamp", 0))
-        sdate = date.fromtimestamp(ts)
-        if sdate == target_date:
-            slug = s["titleSlug"]
-            if slug not in seen:
-                seen[slug] = True
-
-    if not seen:
-        return {"easy": 0, "medium": 0, "hard": 0, "total": 0}
-
-    diff_q = """
-    query questionDifficulty($titleSlug: String!) {
-      question(titleSlug: $titleSlug) {
-        difficulty
-      }
-    }"""
-    counts = {"Easy": 0, "Medium": 0, "Hard": 0}
-    for slug in seen:
-        d2 = gql(diff_q, {"titleSlug": slug}, timeout=10)
+    for s in data.get("recentAcSubmissionList") or []:
         try:
-            diff = d2["question"]["difficulty"]
-            counts[diff] = counts.get(diff, 0) + 1
+            sdate = date.fromtimestamp(int(s.get("timestamp", 0)))
+            slug  = s["titleSlug"]
         except Exception:
+            continue
+        if sdate == target_date and slug not in seen:
+            seen[slug] = True
+    return list(seen)
+
+def count_by_difficulty(slugs: list, difficulties: dict) -> dict:
+    counts = {"Easy": 0, "Medium": 0, "Hard": 0}
+    for slug in slugs:
+        diff = difficulties.get(slug)
+        if diff in counts:
+            counts[diff] += 1
+        else:
             counts["Easy"] += 1
-        time.sleep(0.2)
 
     return {
         "easy":   counts["Easy"],
@@ -162,43 +173,45 @@ def fetch_daily_stats(username: str, target_date: date):
         "total":  counts["Easy"] + counts["Medium"] + counts["Hard"],
     }
 
-def fetch_contest_stats(username: str):
-    q = """
-    query userContestRanking($username: String!) {
-      userContestRanking(username: $username) {
-        rating
-        globalRanking
-        attendedContestsCount
-      }
-      userContestRankingHistory(username: $username) {
-        attended
-        rating
-        ranking
-        problemsSolved
-        totalProblems
-        contest { title startTime }
-      }
-    }"""
-    data = gql(q, {"username": username.strip()})
-    if not data:
-        return None
+def parse_contest_stats(data: dict):
+    cr   = data.get("userContestRanking") or {}
+    hist = data.get("userContestRankingHistory") or []
+    last = next((h for h in reversed(hist) if h.get("attended")), None)
+    return {
+        "rating":          round(cr.get("rating", 0), 1) if cr.get("rating") else "N/A",
+        "global_ranking":  cr.get("globalRanking", "N/A"),
+        "contests_count":  cr.get("attendedContestsCount", 0),
+        "last_contest":    last["contest"]["title"] if last else "N/A",
+        "last_attended":   "Yes" if last else "No",
+        "last_ranking":    last.get("ranking", "N/A") if last else "N/A",
+        "last_solved":     f"{last.get('problemsSolved','?')}/{last.get('totalProblems','?')}" if last else "N/A",
+    }
+
+def _or_none(fn, *args):
     try:
-        cr   = data.get("userContestRanking") or {}
-        hist = data.get("userContestRankingHistory") or []
-        attended = [h for h in hist if h.get("attended")]
-        last = attended[-1] if attended else None
-        return {
-            "rating":          round(cr.get("rating", 0), 1) if cr.get("rating") else "N/A",
-            "global_ranking":  cr.get("globalRanking", "N/A"),
-            "contests_count":  cr.get("attendedContestsCount", 0),
-            "last_contest":    last["contest"]["title"] if last else "N/A",
-            "last_attended":   "Yes" if last else "No",
-            "last_ranking":    last.get("ranking", "N/A") if last else "N/A",
-            "last_solved":     f"{last.get('problemsSolved','?')}/{last.get('totalProblems','?')}" if last else "N/A",
-        }
+        return fn(*args)
     except Exception:
         return None
 
+def fetch_student_stats(username: str, target_date: date) -> dict:
+    """Daily, overall and contest records for one student from a single query
+    (plus one batched difficulty lookup when they solved something today).
+    Each part is parsed on its own; any that fails is None."""
+    data = gql(STUDENT_QUERY, {"username": username.strip(), "limit": 50})
+    if not data:
+        return {"daily": None, "overall": None, "contest": None}
+
+    daily = None
+    slugs = _or_none(parse_solved_slugs, data, target_date)
+    if slugs is not None:
+        difficulties = (_or_none(fetch_difficulties, slugs) or {}) if slugs else {}
+        daily = _or_none(count_by_difficulty, slugs, difficulties)
+    return {
+        "daily":   daily,
+        "overall": _or_none(parse_overall_stats, data),
+        "contest": _or_none(parse_contest_stats, data),
+    }
+
 # ─────────────────────────── EXCEL HELPERS ───────────────────────────────────
 HDR_FILL   = PatternFill("solid", start_color="1F3864", end_color="1F3864")
 DAY_FILL   = PatternFill("solid", start_color="2E75B6", end_color="2E75B6")
@@ -226,20 +239,37 @@ def read_students(wb) -> list[dict]:
     ws   = wb["Sheet1"]
     rows = list(ws.iter_rows(values_only=True))
     header_row = 0
+    # Default layout when no header is found: Name | Reg No | LeetCode ID
+    cols = {"name": 0, "reg": 1, "lc_id": 2, "section": None}
     for i, row in enumerate(rows):
         cells = [str(c).strip().lower() if c else "" for c in row]
         if "name" in cells and any("leetcode" in c for c in cells):
             header_row = i
+            cols = {"name": cells.index("name"), "reg": None, "lc_id": None, "section": None}
+            for c, h in enumerate(cells):
+                if "leetcode" in h:
+                    cols["lc_id"] = c
+                elif h.startswith("reg"):
+                    cols["reg"] = c
+                elif h in ("section", "class"):
+                    cols["section"] = c
             break
+
+    def cell(row, key):
+        c = cols[key]
+        if c is None or c >= len(row) or not row[c]:
+            return ""
+        return str(row[c]).strip()
+
     students = []
     for row in rows[header_row + 1:]:
         if not any(row):
             continue
-        name  = str(row[0]).strip() if row[0] else ""
-        reg   = str(row[1]).strip() if len(row) > 1 and row[1] else ""
-        lc_id = str(row[2]).strip() if len(row) > 2 and row[2] else ""
+        name  = cell(row, "name")
+        lc_id = cell(row, "lc_id")
         if name and lc_id and lc_id.lower() != "nan":
-            students.append({"name": name, "reg": reg, "lc_id": lc_id})
+            students.append({"name": name, "reg": cell(row, "reg"),
+                             "lc_id": lc_id, "section": cell(row, "section")})
     return students
 
 # ─────────────────────────── DAILY TRACKING SHEET ────────────────────────────
@@ -374,19 +404,99 @@ def update_contest_sheet(wb, students: list[dict], contest_data: dict):
             c = ws.cell(row, i+1, val)
             style(c, NORM_FONT, fill, CTR if i > 0 else LEFT)
 
+# ─────────────────────────── SECTION SHEET ───────────────────────────────────
+RESERVED_SHEETS = {"sheet1", "daily tracking", "overall stats", "contest"}
+
+def section_sheet_title(section: str) -> str:
+    """Excel-safe sheet title for a section: no []:*?/\\, at most 31 chars,
+    and never one of the tracker's own sheets."""
+    title = "".join("-" if ch in '[]:*?/\\' else ch for ch in section).strip("' ") or "Section"
+    if title.lower() in RESERVED_SHEETS:
+        title = f"Section {title}"
+    return title[:31]
+
+def section_titles(sections) -> dict:
+    """Section -> unique sheet title. Names that clean up to the same title
+    ("A/B" and "A-B", or a shared 31-char prefix) get " (2)", " (3)", ..."""
+    titles, taken = {}, set()
+    for section in sections:
+        base = title = section_sheet_title(section)
+        n = 1
+        while title.lower() in taken:
+            n += 1
+            suffix = f" ({n})"
+            title  = base[:31 - len(suffix)] + suffix
+        taken.add(title.lower())
+        titles[section] = title
+    return titles
+
+def update_section_sheet(wb, section: str, students: list[dict], today: date,
+                         daily_data: dict, overall_data: dict, title=None):
+    """One sheet per section: today's counts next to overall totals."""
+    # Recreate rather than clear: delete_rows keeps stale merged ranges
+    title = title or section_sheet_title(section)
+    if title in wb.sheetnames:
+        pos = wb.sheetnames.index(title)
+        wb.remove(wb[title])
+        ws = wb.create_sheet(title, pos)
+    else:
+        ws = wb.create_sheet(title)
+
+    cols = ["S.No","Name","Register Number","LeetCode ID",
+            "Daily Easy","Daily Medium","Daily Hard","Daily Total",
+            "Overall Easy","Overall Medium","Overall Hard","Overall Total"]
+    widths = [6, 22, 16, 22, 8, 8, 8, 8, 9, 9, 9, 9]
+
+    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(cols))
+    t = ws.cell(1, 1, f"Section: {section}   |   Date: {today}   |   Total Students: {len(students)}")
+    style(t, DAY_FONT, DAY_FILL, CTR)
+    for i, (col, w) in enumerate(zip(cols, widths)):
+        c = ws.cell(2, i+1, col); style(c, HDR_FONT, HDR_FILL, CTR)
+        ws.column_dimensions[get_column_letter(i+1)].width = w
+
+    for idx, s in enumerate(students):
+        row   = idx + 3
+        fill  = ALT_FILL if idx % 2 == 0 else WHT_FILL
+        lc_id = s["lc_id"]
+        dd    = daily_data.get(lc_id) or {}
+        od    = overall_data.get(lc_id) or {}
+
+        vals = [idx + 1, s["name"], s.get("reg", ""), lc_id]
+        vals += [dd.get(k, 0)   for k in ["easy","medium","hard","total"]]
+        vals += [od.get(k, "?") for k in ["easy","medium","hard","total"]]
+        for i, val in enumerate(vals):
+            c = ws.cell(row, i+1, val)
+            style(c, NORM_FONT, fill, LEFT if i in (1, 2, 3) else CTR)
+
+    # Section totals, one blank row below the last student
+    last  = len(students) + 2
+    total = last + 2
+    ws.merge_cells(start_row=total, start_column=1, end_row=total, end_column=4)
+    t = ws.cell(total, 1, f"SECTION TOTAL — {section}")
+    style(t, HDR_FONT, HDR_FILL, CTR)
+    for col in range(2, len(cols) + 1):
+        letter = get_column_letter(col)
+        c = ws.cell(total, col) if col <= 4 else ws.cell(total, col, f"=SUM({letter}3:{letter}{last})")
+        style(c, HDR_FONT, HDR_FILL, CTR)
+
+def group_by_section(students: list[dict]) -> dict:
+    """Section name -> students, in roster order. Unsectioned rows go to 'All'."""
+    groups = {}
+    for s in students:
+        groups.setdefault(s.get("section") or "All", []).append(s)
+    return groups
+
 # ─────────────────────────── EMAIL FUNCTION ──────────────────────────────────
-def build_email_html(students, daily_data, today):
-    """Build an HTML summary table split by class."""
+def build_email_html(students, daily_data, today, section=None):
+    """Build an HTML summary table for one section (or the whole roster)."""
     today_str = today.strftime("%d %B %Y")
+    title     = f"{section} — {today_str}" if section else today_str
 
-    # Group students by class (based on reg number prefix or name — adapt as needed)
-    # If Sheet1 has a 'class' column (index 3), use that; otherwise group all together
-    # For now, we group by the 4th character of reg number or just show all in one table
     rows_html = ""
     total_solved_today = 0
     for idx, s in enumerate(students):
         lc_id = s["lc_id"]
-        dd    = daily_data.get(lc_id, {})
+        dd    = daily_data.get(lc_id) or {}
         e, m, h, t = dd.get("easy",0), dd.get("medium",0), dd.get("hard",0), dd.get("total",0)
         total_solved_today += t
         bg = "#EAF0FB" if idx % 2 == 0 else "#FFFFFF"
@@ -403,11 +513,11 @@ def build_email_html(students, daily_data, today):
           <td style="padding:6px 10px; text-align:center;"{highlight}>{t}</td>
         </tr>"""
 
-    active_count = sum(1 for s in students if daily_data.get(s["lc_id"], {}).get("total", 0) > 0)
+    active_count = sum(1 for s in students if (daily_data.get(s["lc_id"]) or {}).get("total", 0) > 0)
 
     html = f"""
     <html><body style="font-family:Arial,sans-serif; color:#222;">
-    <h2 style="color:#1F3864;">📊 LeetCode Daily Report — {today_str}</h2>
+    <h2 style="color:#1F3864;">📊 LeetCode Daily Report — {title}</h2>
     <p>
       <strong>Total Students:</strong> {len(students)} &nbsp;|&nbsp;
       <strong>Active Today:</strong> {active_count} &nbsp;|&nbsp;
@@ -430,13 +540,79 @@ def build_email_html(students, daily_data, today):
       <tbody>{rows_html}</tbody>
     </table>
     <p style="margin-top:20px; color:#555; font-size:12px;">
-      Auto-generated by LeetCode Daily Tracker • Full report attached as Excel file.
+      Auto-generated by LeetCode Daily Tracker • Report attached as Excel file.
     </p>
     </body></html>"""
     return html
 
-def send_email(today, students, daily_data):
-    """Send daily report email with Excel attached."""
+def render_section_report(job):
+    """Process-pool worker: write one section's workbook and HTML body.
+
+    Runs in a child process, so it only takes and returns picklable data.
+    """
+    section, title, path, students, today, daily_data, overall_data, contest_data = job
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    update_section_sheet(wb, section, students, today, daily_data, overall_data, title)
+    wb.create_sheet("Contest")
+    update_contest_sheet(wb, students, contest_data)
+    wb.save(path)
+    return section, build_email_html(students, daily_data, today, section), path
+
+def render_section_reports(students, today, daily_data, overall_data, contest_data,
+                           out_dir: Path):
+    """Render every section's workbook (into out_dir) + HTML in parallel.
+    Returns a list of (section, html, xlsx_path) in roster order."""
+    sections = group_by_section(students)
+    titles   = section_titles(sections)
+    jobs, used = [], set()
+    for section, group in sections.items():
+        slug = "".join(ch if ch.isalnum() else "_" for ch in titles[section])
+        name, n = f"leetcode_{slug}_{today}.xlsx", 1
+        while name.lower() in used:
+            n += 1
+            name = f"leetcode_{slug}_{n}_{today}.xlsx"
+        used.add(name.lower())
+
+        ids = [s["lc_id"] for s in group]
+        jobs.append((section, titles[section], out_dir / name, group, today,
+                     {k: daily_data.get(k) or {} for k in ids},
+                     {k: overall_data.get(k) for k in ids},
+                     {k: contest_data.get(k) or {} for k in ids}))
+
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [render_section_report(j) for j in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_section_report, jobs))
+
+def attach_file(msg, path: Path):
+    with open(path, "rb") as f:
+        part = MIMEBase("application", "octet-stream")
+        part.set_payload(f.read())
+    encoders.encode_base64(part)
+    part.add_header("Content-Disposition",
+                    f'attachment; filename="{path.name}"')
+    msg.attach(part)
+
+def build_message(recipient, subject, html_body, attachments=()):
+    msg = MIMEMultipart("mixed")
+    msg["From"]    = SENDER_EMAIL
+    msg["To"]      = recipient
+    msg["Subject"] = subject
+    msg.attach(MIMEText(html_body, "html"))
+    for path in attachments:
+        if path.exists():
+            attach_file(msg, path)
+    return msg
+
+def send_email(today, students, daily_data, overall_data=None, contest_data=None):
+    """Send each mentor one email with their sections' reports attached, over
+    a single SMTP connection.
+
+    With no Section column in Sheet1, or no SECTION_EMAILS configured, this is
+    one email to RECIPIENT_EMAIL with the full Excel attached, as before.
+    """
     log("  Preparing email...")
 
     if SENDER_EMAIL == "YOUR_GMAIL@gmail.com":
@@ -444,34 +620,67 @@ def send_email(today, students, daily_data):
         return
 
     today_str = today.strftime("%d %B %Y")
-    subject   = f"LeetCode Daily Report — {today_str}"
-    html_body = build_email_html(students, daily_data, today)
-
-    msg = MIMEMultipart("mixed")
-    msg["From"]    = SENDER_EMAIL
-    msg["To"]      = RECIPIENT_EMAIL
-    msg["Subject"] = subject
-
-    msg.attach(MIMEText(html_body, "html"))
-
-    # Attach Excel file
-    if EXCEL_FILE.exists():
-        with open(EXCEL_FILE, "rb") as f:
-            part = MIMEBase("application", "octet-stream")
-            part.set_payload(f.read())
-        encoders.encode_base64(part)
-        part.add_header("Content-Disposition",
-                        f'attachment; filename="{EXCEL_FILE.name}"')
-        msg.attach(part)
+    sections  = group_by_section(students)
+
+    outbox = []
+    if list(sections) == ["All"] or not SECTION_EMAILS:
+        if not RECIPIENT_EMAIL:
+            log("  ⚠️  Email skipped: RECIPIENT_EMAIL is not set.")
+            return
+        subject = f"LeetCode Daily Report — {today_str}"
+        html    = build_email_html(students, daily_data, today)
+        outbox.append((RECIPIENT_EMAIL, build_message(RECIPIENT_EMAIL, subject, html, [EXCEL_FILE])))
+    else:
+        # Attachments are read into the messages here, so the workbooks
+        # only need to live until the outbox is built.
+        with tempfile.TemporaryDirectory(prefix="leetcode_sections_") as tmp:
+            t0 = time.time()
+            try:
+                reports = render_section_reports(students, today, daily_data,
+                                                 overall_data or {}, contest_data or {},
+                                                 Path(tmp))
+            except Exception as e:
+                log(f"  ❌ Section reports failed: {e}")
+                return
+            log(f"  Rendered {len(reports)} section reports in {time.time() - t0:.1f}s")
+
+            by_recipient = {}
+            for section, html, path in reports:
+                to = SECTION_EMAILS.get(section) or RECIPIENT_EMAIL
+                if not to:
+                    log(f"  ⚠️  {section}: no SECTION_EMAILS entry and RECIPIENT_EMAIL is not set — skipped")
+                    continue
+                by_recipient.setdefault(to, []).append((section, html, path))
+            for to, items in by_recipient.items():
+                names = [section for section, _, _ in items]
+                if len(items) == 1:
+                    label, html = names[0], items[0][1]
+                else:
+                    label = f"{len(items)} sections"
+                    group = [s for s in students if (s.get("section") or "All") in names]
+                    html  = build_email_html(group, daily_data, today, ", ".join(names))
+                subject = f"LeetCode Daily Report — {label} — {today_str}"
+                outbox.append((to, build_message(to, subject, html, [p for _, _, p in items])))
+
+    if not outbox:
+        return
 
     try:
         with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(SENDER_EMAIL, SENDER_PASSWORD)
-            server.sendmail(SENDER_EMAIL, RECIPIENT_EMAIL, msg.as_string())
-        log(f"  ✅ Email sent to {RECIPIENT_EMAIL}")
-    except Exception as e:
-        log(f"  ❌ Email failed: {e}")
-        log(f"     Check SENDER_EMAIL, SENDER_PASSWORD, and Gmail App Password settings.")
+            try:
+                server.login(SENDER_EMAIL, SENDER_PASSWORD)
+            except smtplib.SMTPException as e:
+                log(f"  ❌ Email failed: {e}")
+                log(f"     Check SENDER_EMAIL, SENDER_PASSWORD, and Gmail App Password settings.")
+                return
+            for to, msg in outbox:
+                try:
+                    server.sendmail(SENDER_EMAIL, to, msg.as_string())
+                    log(f"  ✅ Email sent to {to}  ({msg['Subject']})")
+                except smtplib.SMTPException as e:
+                    log(f"  ❌ Email to {to} failed: {e}")
+    except OSError as e:
+        log(f"  ❌ Email failed: could not connect to smtp.gmail.com: {e}")
 
 # ─────────────────────────── TASK SCHEDULER ──────────────────────────────────
 def register_tasks():
@@ -501,6 +710,28 @@ def register_tasks():
     else:
         log("  ⚠️  Task 2 registration failed — run as Administrator once")
 
+# ─────────────────────────── SNAPSHOTS ───────────────────────────────────────
+def save_snapshot(today, students, daily_data, overall_data, contest_data):
+    """One JSON file per run date — the query service reads these.
+
+    daily_data holds None for students whose fetch failed, so the query
+    service can tell "not fetched" apart from "solved nothing". The file is
+    written beside the target and swapped in, so --serve never reads half of it.
+    """
+    SNAPSHOT_DIR.mkdir(exist_ok=True)
+    path = SNAPSHOT_DIR / f"{today}.json"
+    tmp  = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({
+            "date": str(today),
+            "students": students,
+            "daily_data": daily_data,
+            "overall_data": overall_data,
+            "contest_data": contest_data,
+        }, f, ensure_ascii=False)
+    os.replace(tmp, path)
+    log(f"  💾 Snapshot saved: {path}")
+
 # ─────────────────────────── FETCH MODE ──────────────────────────────────────
 def run_fetch():
     """Fetch LeetCode data and save to Excel. Called at 9:15 PM."""
@@ -528,6 +759,7 @@ def run_fetch():
     daily_data   = {}
     overall_data = {}
     contest_data = {}
+    fetched      = {}   # lc_id -> daily record, or None when the fetch failed
 
     for s in students:
         name  = s["name"]
@@ -535,27 +767,16 @@ def run_fetch():
         log(f"  Fetching: {name}  ({lc_id})")
 
         try:
-            dd = fetch_daily_stats(lc_id, today)
-            daily_data[lc_id] = dd or {"easy":0,"medium":0,"hard":0,"total":0}
-            d = daily_data[lc_id]
-            log(f"    Daily  : E={d['easy']} M={d['medium']} H={d['hard']} T={d['total']}")
+            stats = fetch_student_stats(lc_id, today)
         except Exception as e:
-            log(f"    [WARN] fetch_daily_stats: {e}")
-            daily_data[lc_id] = {"easy":0,"medium":0,"hard":0,"total":0}
-
-        try:
-            od = fetch_overall_stats(lc_id)
-            overall_data[lc_id] = od or {}
-        except Exception as e:
-            log(f"    [WARN] fetch_overall_stats: {e}")
-            overall_data[lc_id] = {}
-
-        try:
-            cd = fetch_contest_stats(lc_id)
-            contest_data[lc_id] = cd or {}
-        except Exception as e:
-            log(f"    [WARN] fetch_contest_stats: {e}")
-            contest_data[lc_id] = {}
+            log(f"    [WARN] fetch_student_stats: {e}")
+            stats = {}
+        fetched[lc_id]      = stats.get("daily")
+        daily_data[lc_id]   = stats.get("daily") or {"easy":0,"medium":0,"hard":0,"total":0}
+        overall_data[lc_id] = stats.get("overall") or {}
+        contest_data[lc_id] = stats.get("contest") or {}
+        d = daily_data[lc_id]
+        log(f"    Daily  : E={d['easy']} M={d['medium']} H={d['hard']} T={d['total']}")
 
         time.sleep(1.0)
 
@@ -564,6 +785,12 @@ def run_fetch():
     update_daily_sheet(wb, students, today, daily_data)
     update_overall_sheet(wb, students, today, overall_data)
     update_contest_sheet(wb, students, contest_data)
+    sections = group_by_section(students)
+    titles   = section_titles(sections)
+    for section, group in sections.items():
+        if section != "All":
+            update_section_sheet(wb, section, group, today, daily_data, overall_data,
+                                 titles[section])
     wb.save(EXCEL_FILE)
     log(f"  💾 Saved: {EXCEL_FILE}")
 
@@ -573,9 +800,12 @@ def run_fetch():
         json.dump({
             "date": str(today),
             "daily_data": daily_data,
+            "overall_data": overall_data,
+            "contest_data": contest_data,
             "students": students
         }, f, ensure_ascii=False, indent=2)
     log(f"  💾 Data cached for email: {cache_file}")
+    save_snapshot(today, students, fetched, overall_data, contest_data)
     log()
 
 # ─────────────────────────── EMAIL MODE ──────────────────────────────────────
@@ -596,21 +826,21 @@ def run_email():
     try:
         with open(cache_file, "r", encoding="utf-8") as f:
             cache = json.load(f)
-        students   = cache["students"]
-        daily_data = cache["daily_data"]
         cached_date = cache.get("date", "")
         if cached_date != str(today):
             log(f"  ⚠️  Cache is from {cached_date}, today is {today}. Re-fetching...")
             run_fetch()
             with open(cache_file, "r", encoding="utf-8") as f:
                 cache = json.load(f)
-            students   = cache["students"]
-            daily_data = cache["daily_data"]
+        students     = cache["students"]
+        daily_data   = cache["daily_data"]
+        overall_data = cache.get("overall_data", {})
+        contest_data = cache.get("contest_data", {})
     except Exception as e:
         log(f"  ERROR reading cache: {e}")
         return
 
-    send_email(today, students, daily_data)
+    send_email(today, students, daily_data, overall_data, contest_data)
     log()
 
 # ─────────────────────────── FULL RUN (fetch + email together) ───────────────
@@ -643,6 +873,7 @@ def run_all():
     daily_data   = {}
     overall_data = {}
     contest_data = {}
+    fetched      = {}   # lc_id -> daily record, or None when the fetch failed
 
     for idx, s in enumerate(students):
         name  = s["name"]
@@ -650,27 +881,16 @@ def run_all():
         log(f"  [{idx+1}/{len(students)}] {name}  ({lc_id})")
 
         try:
-            dd = fetch_daily_stats(lc_id, today)
-            daily_data[lc_id] = dd or {"easy":0,"medium":0,"hard":0,"total":0}
-            d = daily_data[lc_id]
-            log(f"    Daily  : E={d['easy']} M={d['medium']} H={d['hard']} T={d['total']}")
+            stats = fetch_student_stats(lc_id, today)
         except Exception as e:
-            log(f"    [WARN] fetch_daily_stats: {e}")
-            daily_data[lc_id] = {"easy":0,"medium":0,"hard":0,"total":0}
-
-        try:
-            od = fetch_overall_stats(lc_id)
-            overall_data[lc_id] = od or {}
-        except Exception as e:
-            log(f"    [WARN] fetch_overall_stats: {e}")
-            overall_data[lc_id] = {}
-
-        try:
-            cd = fetch_contest_stats(lc_id)
-            contest_data[lc_id] = cd or {}
-        except Exception as e:
-            log(f"    [WARN] fetch_contest_stats: {e}")
-            contest_data[lc_id] = {}
+            log(f"    [WARN] fetch_student_stats: {e}")
+            stats = {}
+        fetched[lc_id]      = stats.get("daily")
+        daily_data[lc_id]   = stats.get("daily") or {"easy":0,"medium":0,"hard":0,"total":0}
+        overall_data[lc_id] = stats.get("overall") or {}
+        contest_data[lc_id] = stats.get("contest") or {}
+        d = daily_data[lc_id]
+        log(f"    Daily  : E={d['easy']} M={d['medium']} H={d['hard']} T={d['total']}")
 
         time.sleep(1.0)
 
@@ -680,21 +900,304 @@ def run_all():
     update_daily_sheet(wb, students, today, daily_data)
     update_overall_sheet(wb, students, today, overall_data)
     update_contest_sheet(wb, students, contest_data)
+    sections = group_by_section(students)
+    titles   = section_titles(sections)
+    for section, group in sections.items():
+        if section != "All":
+            update_section_sheet(wb, section, group, today, daily_data, overall_data,
+                                 titles[section])
     wb.save(EXCEL_FILE)
     log(f"  💾 Excel saved: {EXCEL_FILE}")
+    save_snapshot(today, students, fetched, overall_data, contest_data)
     log()
     log("=" * 55)
     log("  Step 2 of 2 — Sending email now...")
     log("=" * 55)
-    send_email(today, students, daily_data)
+    send_email(today, students, daily_data, overall_data, contest_data)
     log()
     log("  🎉 All done! Data fetched + Email sent.")
     log()
 
+# ─────────────────────────── QUERY SERVICE ───────────────────────────────────
+# Read-only, offline queries over snapshots/*.json (written by every fetch):
+#   python leetcode_tracker.py --query aggregate lc_id=foo days=7
+#   python leetcode_tracker.py --query inactive days=5 section="CSE J"
+#   python leetcode_tracker.py --serve   →  GET /leaderboard?metric=medium&days=7
+# Common params: from / to (YYYY-MM-DD) or days=N (last N days up to `to`),
+# section, limit.
+DAILY_KEYS = ["easy", "medium", "hard", "total"]
+
+def snapshot_version():
+    """Changes whenever a run writes a new (or rewrites an old) snapshot."""
+    files = list(SNAPSHOT_DIR.glob("*.json")) if SNAPSHOT_DIR.exists() else []
+    return (len(files), max((f.stat().st_mtime_ns for f in files), default=0))
+
+@lru_cache(maxsize=1)
+def load_index(version):
+    """Load every snapshot once and precompute lookups by lc_id and date.
+
+    prefix[lc_id][i] holds running (easy, medium, hard, total, active_days,
+    fetched_days) over the first i snapshot dates, so any date-range sum is
+    one subtraction. Days whose fetch failed (daily record null) are left out
+    of history and counted in none of them.
+    """
+    snaps = []
+    for path in sorted(SNAPSHOT_DIR.glob("*.json")) if SNAPSHOT_DIR.exists() else []:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snaps.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            log(f"  [query] WARN skipping unreadable snapshot {path.name}: {e}")
+    snaps.sort(key=lambda snap: snap["date"])
+
+    dates, students, history, overall, contest = [], {}, {}, {}, {}
+    roster = []
+    for snap in snaps:
+        dates.append(date.fromisoformat(snap["date"]))
+        daily_data   = snap.get("daily_data")   or {}
+        overall_data = snap.get("overall_data") or {}
+        contest_data = snap.get("contest_data") or {}
+        roster = []
+        for st in snap.get("students", []):
+            lc_id = st["lc_id"].strip()
+            key   = lc_id.lower()
+            roster.append(key)
+            students[key] = st
+            by_date = history.setdefault(key, {})
+            if daily_data.get(lc_id) is not None:
+                by_date[dates[-1]] = daily_data[lc_id]
+            if overall_data.get(lc_id):
+                overall[key] = overall_data[lc_id]
+            if contest_data.get(lc_id):
+                contest[key] = contest_data[lc_id]
+
+    prefix = {}
+    for key, by_date in history.items():
+        run, rows = [0] * 6, [(0,) * 6]
+        for d in dates:
+            dd = by_date.get(d)
+            if dd is not None:
+                for i, k in enumerate(DAILY_KEYS):
+                    run[i] += dd.get(k, 0) or 0
+                run[4] += 1 if (dd.get("total", 0) or 0) > 0 else 0
+                run[5] += 1
+            rows.append(tuple(run))
+        prefix[key] = rows
+
+    return {"dates": dates, "roster": roster, "students": students,
+            "history": history, "overall": overall, "contest": contest,
+            "prefix": prefix}
+
+def _query_range(index, params):
+    """(lo, hi) slice into index['dates'] for from/to/days params."""
+    dates = index["dates"]
+    if not dates:
+        raise ValueError("no snapshots yet — run a fetch first")
+    end   = date.fromisoformat(params["to"]) if params.get("to") else dates[-1]
+    if params.get("from"):
+        start = date.fromisoformat(params["from"])
+    elif params.get("days"):
+        start = end - timedelta(days=int(params["days"]) - 1)
+    else:
+        start = dates[0]
+    if start > end:
+        raise ValueError(f"from ({start}) is after to ({end})")
+    return bisect_left(dates, start), bisect_right(dates, end), start, end
+
+TOTAL_KEYS = DAILY_KEYS + ["active_days", "fetched_days"]
+
+def _range_totals(index, key, lo, hi):
+    rows = index["prefix"].get(key)
+    if not rows:
+        return dict.fromkeys(TOTAL_KEYS, 0)
+    a, b = rows[lo], rows[hi]
+    return {k: b[i] - a[i] for i, k in enumerate(TOTAL_KEYS)}
+
+def _student_row(index, key):
+    st = index["students"][key]
+    return {"name": st["name"], "lc_id": st["lc_id"], "section": st.get("section", "")}
+
+def _roster(index, params):
+    section = params.get("section")
+    return [k for k in index["roster"]
+            if not section or index["students"][k].get("section") == section]
+
+def _student_key(index, params):
+    lc_id = (params.get("lc_id") or "").strip()
+    if not lc_id:
+        raise ValueError("lc_id is required")
+    key = lc_id.lower()
+    if key not in index["students"]:
+        raise ValueError(f"unknown lc_id: {lc_id}")
+    return key
+
+def query_student(index, params):
+    """Day-by-day history for one student plus latest overall/contest stats."""
+    key = _student_key(index, params)
+    lo, hi, start, end = _query_range(index, params)
+    by_date = index["history"][key]
+    days = [{"date": str(d), **{k: (by_date.get(d) or {}).get(k, 0) for k in DAILY_KEYS}}
+            for d in index["dates"][lo:hi] if d in by_date]
+    return {**_student_row(index, key), "from": str(start), "to": str(end),
+            "totals":  _range_totals(index, key, lo, hi),
+            "history": days,
+            "overall": index["overall"].get(key, {}),
+            "contest": index["contest"].get(key, {})}
+
+def query_aggregate(index, params):
+    """Easy/medium/hard/total and active days over a date range, per student."""
+    lo, hi, start, end = _query_range(index, params)
+    keys = [_student_key(index, params)] if params.get("lc_id") else _roster(index, params)
+    rows = [{**_student_row(index, k), **_range_totals(index, k, lo, hi)} for k in keys]
+    return {"from": str(start), "to": str(end), "students": rows}
+
+def query_inactive(index, params):
+    """Students with no accepted submission in the last `days` days (default 5).
+
+    Students whose every fetch in the range failed are listed under
+    "unknown" rather than counted as inactive.
+    """
+    params = {"days": "5", **params}
+    lo, hi, start, end = _query_range(index, params)
+    rows, unknown = [], []
+    for key in _roster(index, params):
+        totals = _range_totals(index, key, lo, hi)
+        if totals["active_days"]:
+            continue
+        if not totals["fetched_days"]:
+            unknown.append(_student_row(index, key))
+            continue
+        active = [d for d, dd in index["history"][key].items()
+                  if d <= end and (dd.get("total", 0) or 0) > 0]
+        rows.append({**_student_row(index, key),
+                     "last_active": str(max(active)) if active else None})
+    return {"from": str(start), "to": str(end), "count": len(rows), "students": rows,
+            "unknown": unknown}
+
+LEADERBOARD_METRICS = DAILY_KEYS + ["active_days"] + [f"overall_{k}" for k in DAILY_KEYS] + ["rating"]
+
+def query_leaderboard(index, params):
+    """Top students by metric: easy/medium/hard/total/active_days over the
+    range, or overall_<easy|medium|hard|total> / rating from the latest run."""
+    metric = params.get("metric", "total")
+    limit  = int(params.get("limit", 10))
+    if limit <= 0:
+        raise ValueError(f"limit must be positive, got {limit}")
+    if metric not in LEADERBOARD_METRICS:
+        raise ValueError(f"unknown metric: {metric} (expected one of: {', '.join(LEADERBOARD_METRICS)})")
+    lo, hi, start, end = _query_range(index, params)
+
+    def score(key):
+        if metric in DAILY_KEYS or metric == "active_days":
+            return _range_totals(index, key, lo, hi)[metric]
+        if metric == "rating":
+            v = index["contest"].get(key, {}).get("rating")
+        else:
+            v = index["overall"].get(key, {}).get(metric[len("overall_"):])
+        return v if isinstance(v, (int, float)) else 0
+
+    ranked = sorted(((score(k), k) for k in _roster(index, params)),
+                    key=lambda x: x[0], reverse=True)[:limit]
+    return {"metric": metric, "from": str(start), "to": str(end),
+            "students": [{"rank": i + 1, **_student_row(index, k), metric: v}
+                         for i, (v, k) in enumerate(ranked)]}
+
+QUERIES = {
+    "student":     query_student,
+    "aggregate":   query_aggregate,
+    "inactive":    query_inactive,
+    "leaderboard": query_leaderboard,
+}
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_query(version, kind, params):
+    return QUERIES[kind](load_index(version), dict(params))
+
+_index_version = None
+
+class UnknownQuery(Exception):
+    """run_query was asked for a kind that is not in QUERIES."""
+
+def run_query(kind: str, params: dict):
+    """Answer a query from the LRU; a new snapshot on disk invalidates it."""
+    global _index_version
+    if kind not in QUERIES:
+        raise UnknownQuery(kind)
+    version = snapshot_version()
+    if version != _index_version:
+        _cached_query.cache_clear()
+        load_index.cache_clear()
+        _index_version = version
+    return _cached_query(version, kind, tuple(sorted(params.items())))
+
+class QueryHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url    = urlparse(self.path)
+        kind   = url.path.strip("/")
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            code, body = 200, run_query(kind, params)
+        except UnknownQuery:
+            code, body = 404, {"error": f"unknown query '{kind}'", "queries": list(QUERIES)}
+        except ValueError as e:
+            code, body = 400, {"error": str(e)}
+        except Exception as e:
+            log(f"  [query] ERROR {kind}: {e!r}")
+            code, body = 500, {"error": f"{type(e).__name__}: {e}"}
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):
+        log(f"  [query] {fmt % args}")
+
+def run_serve():
+    """Serve QUERIES over HTTP on localhost until Ctrl+C."""
+    log()
+    log("╔══════════════════════════════════════════════╗")
+    log("║    LeetCode Daily Tracker v4 — QUERY API     ║")
+    log("╚══════════════════════════════════════════════╝")
+    log(f"  Snapshots : {SNAPSHOT_DIR}")
+    log(f"  Listening : http://{QUERY_HOST}:{QUERY_PORT}/  ({', '.join(QUERIES)})")
+    server = ThreadingHTTPServer((QUERY_HOST, QUERY_PORT), QueryHandler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def run_query_cli(args):
+    """--query <kind> key=value ... — prints the JSON answer."""
+    if not args:
+        print(f"Usage: --query <{'|'.join(QUERIES)}> [key=value ...]")
+        return
+    kind   = args[0]
+    params = dict(a.split("=", 1) for a in args[1:] if "=" in a)
+    try:
+        print(json.dumps(run_query(kind, params), ensure_ascii=False, indent=2))
+    except UnknownQuery:
+        print(f"ERROR: unknown query '{kind}' (expected one of: {', '.join(QUERIES)})")
+    except ValueError as e:
+        print(f"ERROR: {e}")
+    except Exception as e:
+        print(f"ERROR: {type(e).__name__}: {e}")
+
 # ─────────────────────────── MAIN ────────────────────────────────────────────
 def main():
     args = sys.argv[1:]
 
+    if "--query" in args:
+        run_query_cli(args[args.index("--query") + 1:])
+        return
+
+    if "--serve" in args:
+        run_serve()
+        return
+
     if "--fetch" in args:
         run_fetch()
         return